@@ -33,27 +33,22 @@ def chunk_section_text(
     if not clean_text:
         return []
 
-    tokens = list(clean_text)
+    length = len(clean_text)
     chunks: List[TextChunk] = []
-    start = 0
-    index = 0
-    step = chunk_size - overlap
 
-    while start < len(tokens):
-        end = min(start + chunk_size, len(tokens))
-        chunk_text = "".join(tokens[start:end]).strip()
+    for start in range(0, length, chunk_size - overlap):
+        end = min(start + chunk_size, length)
+        chunk_text = clean_text[start:end].strip()
         if chunk_text:
             chunks.append(
                 TextChunk(
                     section=section_name,
-                    index=index,
+                    index=len(chunks),
                     text=chunk_text,
                     start_offset=start,
                     end_offset=end,
                 )
             )
-            index += 1
-        start += step
 
     return chunks
 
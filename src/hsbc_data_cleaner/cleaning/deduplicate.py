@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import hashlib
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import orjson
 
 from ..parsers.pdf_parser import PdfSection
 
@@ -18,26 +19,36 @@ _DEFAULT_INDEX_PATH = Path("state") / "chunk_index.json"
 class SectionHashResult:
     key: str
     name: str
-    current_hash: str
-    status: str  # new | updated | reuse
+    current_hash: Optional[str]  # None for removed sections
+    status: str  # new | updated | reuse | removed
     previous_hash: Optional[str]
+    # Quarter whose index entry the status was decided against, if any.
+    compared_quarter: Optional[str] = None
 
 
 def compute_hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def compute_hashes(texts: Iterable[str]) -> List[str]:
+    """Hash many texts in one call, matching ``compute_hash`` per item."""
+
+    sha256 = hashlib.sha256
+    return [sha256(text.encode("utf-8")).hexdigest() for text in texts]
+
+
 def load_index(path: Path) -> Dict[str, Dict[str, Dict[str, Dict[str, str]]]]:
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return orjson.loads(path.read_bytes())
 
 
 def save_index(data: Dict, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, ensure_ascii=False, indent=2)
+    # Write to a sibling file first so an interrupted run never truncates the index.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    tmp_path.replace(path)
 
 
 def evaluate_sections(
@@ -45,8 +56,26 @@ def evaluate_sections(
     quarter: str,
     sections: Iterable[PdfSection],
     index_path: Path = _DEFAULT_INDEX_PATH,
+    index: Optional[Dict] = None,
+    texts: Optional[Sequence[str]] = None,
 ) -> List[SectionHashResult]:
-    index = load_index(index_path)
+    """Classify sections against the chunk index and record their hashes.
+
+    When ``index`` is given it is updated in place and the caller is responsible
+    for persisting it; otherwise the index is loaded from and saved to
+    ``index_path``. ``texts`` may carry the already joined ``section.text`` values
+    so callers that need them again do not join each section twice.
+
+    Sections recorded for the compared quarter (this quarter on a re-run,
+    otherwise the previous one) that are no longer present are reported after
+    the current sections with status ``removed``.
+    """
+
+    # Sections are walked more than once below; accept one-shot iterators too.
+    sections = list(sections)
+    owns_index = index is None
+    if owns_index:
+        index = load_index(index_path)
     fund_entry = index.setdefault(fund_id, {})
 
     existing_current_map = fund_entry.get(quarter)
@@ -55,15 +84,20 @@ def evaluate_sections(
     results: List[SectionHashResult] = []
     new_current_map: Dict[str, Dict[str, str]] = {}
 
-    for idx, section in enumerate(sections):
-        key = f"{section.name}:{idx}"
-        current_hash = compute_hash(section.text)
+    keys = [f"{section.name}:{idx}" for idx, section in enumerate(sections)]
+    if texts is None:
+        texts = [section.text for section in sections]
+    section_hashes = compute_hashes(texts)
+
+    for key, current_hash, section in zip(keys, section_hashes, sections):
         previous_hash = None
         status = "new"
+        compared_quarter = None
 
         # Prefer comparing with existing data of the same quarter (re-run scenario)
         if existing_current_map and key in existing_current_map:
             previous_hash = existing_current_map[key].get("hash")
+            compared_quarter = quarter
             if previous_hash == current_hash:
                 status = "reuse"
             else:
@@ -72,6 +106,7 @@ def evaluate_sections(
             prev_entry = previous_map.get(key)
             if prev_entry:
                 previous_hash = prev_entry.get("hash")
+                compared_quarter = previous_quarter
                 if previous_hash == current_hash:
                     status = "reuse"
                 else:
@@ -85,24 +120,107 @@ def evaluate_sections(
                 current_hash=current_hash,
                 status=status,
                 previous_hash=previous_hash,
+                compared_quarter=compared_quarter,
             )
         )
 
+    if existing_current_map:
+        baseline_quarter, baseline_map = quarter, existing_current_map
+    else:
+        baseline_quarter, baseline_map = previous_quarter, previous_map or {}
+    for key, entry in baseline_map.items():
+        if key not in new_current_map:
+            results.append(
+                SectionHashResult(
+                    key=key,
+                    name=entry.get("section", key),
+                    current_hash=None,
+                    status="removed",
+                    previous_hash=entry.get("hash"),
+                    compared_quarter=baseline_quarter,
+                )
+            )
+
     fund_entry[quarter] = new_current_map
-    save_index(index, index_path)
+    if owns_index:
+        save_index(index, index_path)
     return results
 
 
+@dataclass
+class ChunkIndex:
+    """In-memory chunk index loaded once and saved when the ``with`` block exits.
+
+    ``evaluate`` stages a fund's new entry; it only becomes part of ``data``
+    once ``commit`` is called (e.g. after that fund's chunks were written), so
+    a failure part-way through a run keeps the funds already committed.
+    """
+
+    path: Path
+    data: Dict[str, Dict[str, Dict[str, Dict[str, str]]]] = field(default_factory=dict)
+    _pending: Dict[str, Dict[str, Dict[str, Dict[str, str]]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _dirty: bool = field(default=False, init=False, repr=False)
+
+    @classmethod
+    def load(cls, path: Path) -> "ChunkIndex":
+        return cls(path=path, data=load_index(path))
+
+    def evaluate(
+        self,
+        fund_id: str,
+        quarter: str,
+        sections: Iterable[PdfSection],
+        texts: Optional[Sequence[str]] = None,
+    ) -> List[SectionHashResult]:
+        # Compare against committed data, but stage the update on a copy of
+        # the fund's quarter map until ``commit``.
+        fund_entry = self._pending.get(fund_id, self.data.get(fund_id, {}))
+        staged = {fund_id: dict(fund_entry)}
+        results = evaluate_sections(
+            fund_id=fund_id,
+            quarter=quarter,
+            sections=sections,
+            index_path=self.path,
+            index=staged,
+            texts=texts,
+        )
+        self._pending[fund_id] = staged[fund_id]
+        return results
+
+    def commit(self) -> None:
+        """Make every staged entry part of the index that will be saved."""
+
+        if self._pending:
+            self.data.update(self._pending)
+            self._pending.clear()
+            self._dirty = True
+
+    def save(self) -> None:
+        save_index(self.data, self.path)
+
+    def __enter__(self) -> "ChunkIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        # On failure only what was already committed is kept; entries staged
+        # for the fund being processed are dropped.
+        if exc_type is None:
+            self.commit()
+        else:
+            self._pending.clear()
+        if self._dirty:
+            self.save()
+
+
 def _find_previous_quarter(
     fund_entry: Dict[str, Dict[str, Dict[str, str]]],
     quarter: str,
 ) -> Tuple[Optional[str], Optional[Dict[str, Dict[str, str]]]]:
-    available = [q for q in fund_entry.keys() if q != quarter]
-    if not available:
+    # Quarter keys (YYYYQ#) sort lexically, so a single max() pass finds the
+    # latest other quarter without building and sorting a list.
+    prev_quarter = max((q for q in fund_entry if q != quarter), default=None)
+    if prev_quarter is None:
         return None, None
-    try:
-        sorted_quarters = sorted(available)
-    except TypeError:
-        sorted_quarters = available
-    prev_quarter = sorted_quarters[-1]
     return prev_quarter, fund_entry.get(prev_quarter)
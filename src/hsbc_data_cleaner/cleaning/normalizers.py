@@ -7,6 +7,7 @@ from typing import Iterable, List
 
 
 WHITESPACE_RE = re.compile(r"\s+")
+PUNCTUATION_SPACING_RE = re.compile(r"([,;:])(?=\S)")
 FULLWIDTH_PUNCTUATION = {
     "，": ",",
     "、": ",",
@@ -19,6 +20,7 @@ FULLWIDTH_PUNCTUATION = {
     "）": ")",
     "％": "%",
 }
+FULLWIDTH_TRANSLATION = str.maketrans(FULLWIDTH_PUNCTUATION)
 
 
 def normalize_line(text: str) -> str:
@@ -27,10 +29,10 @@ def normalize_line(text: str) -> str:
     if not text:
         return ""
 
-    normalized = text.strip()
-    for src, dst in FULLWIDTH_PUNCTUATION.items():
-        normalized = normalized.replace(src, dst)
-    normalized = WHITESPACE_RE.sub(" ", normalized)
+    normalized = text.translate(FULLWIDTH_TRANSLATION)
+    # split()/join() trims and collapses whitespace runs exactly like
+    # WHITESPACE_RE.sub(" ", ...) on a stripped line, without the regex engine.
+    normalized = " ".join(normalized.split())
     normalized = _ensure_spacing_after_punctuation(normalized)
     return normalized
 
@@ -38,16 +40,9 @@ def normalize_line(text: str) -> str:
 def normalize_lines(lines: Iterable[str]) -> List[str]:
     """Normalize an iterable of lines, dropping empty results."""
 
-    result: List[str] = []
-    for line in lines:
-        normalized = normalize_line(line)
-        if normalized:
-            result.append(normalized)
-    return result
+    return [normalized for normalized in map(normalize_line, lines) if normalized]
 
 
 def _ensure_spacing_after_punctuation(text: str) -> str:
     # Ensure common punctuation is followed by a space when letter/number follows.
-    for symbol in [",", ";", ":"]:
-        text = re.sub(rf"{re.escape(symbol)}(?=\S)", symbol + " ", text)
-    return text
+    return PUNCTUATION_SPACING_RE.sub(r"\1 ", text)
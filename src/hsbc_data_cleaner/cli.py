@@ -67,6 +67,11 @@ def clean(
         False,
         help="Upload generated chunks to the configured Drive folder after cleaning.",
     ),
+    workers: Optional[int] = typer.Option(
+        None,
+        min=1,
+        help="Number of processes used to filter and parse PDFs (defaults to CPU count).",
+    ),
 ) -> None:
     """Run the cleaning pipeline for a specific quarter."""
 
@@ -79,6 +84,7 @@ def clean(
         chunks_dir=chunks_dir,
         incremental=incremental,
         upload=upload,
+        max_workers=workers,
     )
 
 
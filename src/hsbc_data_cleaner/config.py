@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 try:  # Python 3.11+
     import tomllib  # type: ignore[attr-defined]
@@ -14,7 +15,7 @@ except ModuleNotFoundError:  # pragma: no cover - Python <3.11 fallback
     import tomli as tomllib  # type: ignore[no-redef]
 
 
-_QUARTER_PATTERN = re.compile(r"^(?P<year>\d{4})[- ]?Q(?P<q>[1-4])$")
+_QUARTER_PATTERN = re.compile(r"^(?P<year>\d{4})[- ]?Q(?P<q>[1-4])$", re.IGNORECASE)
 _CONFIG_ENV_VAR = "HSBC_DATA_CLEANER_CONFIG"
 
 
@@ -29,6 +30,9 @@ class AppConfig:
     state_dir: Path = Path("state")
     log_dir: Path = Path("logs")
     drive_folder_id: Optional[str] = None
+    _resolve_cache: Dict[Tuple[Path, str], Path] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         self.raw_dir = Path(self.raw_dir)
@@ -41,8 +45,19 @@ class AppConfig:
             self.drive_folder_id = self.drive_folder_id.strip() or None
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def normalize_quarter(quarter: str) -> str:
-        match = _QUARTER_PATTERN.match(quarter.strip())
+        candidate = quarter.strip()
+        # Fast path for the canonical ``YYYYQ#`` spelling used by the CLI.
+        if (
+            len(candidate) == 6
+            and candidate[4] in "Qq"
+            and candidate[:4].isdecimal()
+            and candidate[5] in "1234"
+        ):
+            return f"{candidate[:4]}Q{candidate[5]}"
+
+        match = _QUARTER_PATTERN.match(candidate)
         if not match:
             raise ValueError(
                 "Quarter must be in the format YYYYQ#, e.g. 2025Q2 (case-insensitive)."
@@ -58,19 +73,29 @@ class AppConfig:
 
     def resolve_input_dir(self, quarter: str, override: Optional[Path] = None) -> Path:
         base = Path(override) if override else self.raw_dir
-        return base / self.quarter_folder_name(quarter)
+        return self._resolve_quarter_dir(base, quarter)
 
     def resolve_clean_chunks_dir(self, quarter: str, override: Optional[Path] = None) -> Path:
         base = Path(override) if override else self.clean_chunks_dir
-        return base / self.quarter_folder_name(quarter)
+        return self._resolve_quarter_dir(base, quarter)
 
     def resolve_clean_pdf_dir(self, quarter: str, override: Optional[Path] = None) -> Path:
         base = Path(override) if override else self.clean_pdf_dir
-        return base / self.quarter_folder_name(quarter)
+        return self._resolve_quarter_dir(base, quarter)
 
     def resolve_structured_dir(self, quarter: str, override: Optional[Path] = None) -> Path:
         base = Path(override) if override else self.structured_dir
-        return base / self.quarter_folder_name(quarter)
+        return self._resolve_quarter_dir(base, quarter)
+
+    def _resolve_quarter_dir(self, base: Path, quarter: str) -> Path:
+        # Keyed on the base directory, so reassigning a *_dir attribute never
+        # returns a stale path.
+        key = (base, quarter)
+        resolved = self._resolve_cache.get(key)
+        if resolved is None:
+            resolved = base / self.quarter_folder_name(quarter)
+            self._resolve_cache[key] = resolved
+        return resolved
 
 
 def load_app_config(config_path: Optional[Path] = None) -> AppConfig:
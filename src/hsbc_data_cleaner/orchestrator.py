@@ -2,28 +2,44 @@
 
 from __future__ import annotations
 
-import json
+import glob
 import logging
+import multiprocessing
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import orjson
 
 from . import __version__
 from .chunking.chunker import chunk_section_text, generate_change_summary
-from .cleaning.deduplicate import SectionHashResult, compute_hash, evaluate_sections
+from .cleaning.deduplicate import ChunkIndex, SectionHashResult, compute_hashes
 from .config import AppConfig
 from .outputs.writer_structured import (
     append_top_holdings_companies,
     append_top_holdings_fixed_income,
 )
 from .parsers.pdf_parser import (
+    ParseResult,
     PdfSection,
     extract_top_holdings_entries,
+    parse_page_texts,
     parse_pdf_sections,
 )
-from .preprocessing.english_filter import remove_english_pages
+from .preprocessing.english_filter import (
+    EnglishFilterResult,
+    prune_classification_cache,
+    remove_english_pages,
+)
+from .utils.logging import forward_worker_logging, init_worker_logging
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +50,17 @@ class FundMetadata:
     name: str
 
 
+@dataclass(frozen=True)
+class ExtractedPdf:
+    """Per-PDF filtering and parsing output produced by a worker."""
+
+    input_pdf: Path
+    filter_result: EnglishFilterResult
+    sections: ParseResult
+    equity_companies: List[str]
+    fixed_income_holdings: List[str]
+
+
 def run_cleaning(
     settings: AppConfig,
     quarter: str,
@@ -42,14 +69,19 @@ def run_cleaning(
     chunks_dir: Optional[Path] = None,
     incremental: bool = True,
     upload: bool = False,
+    max_workers: Optional[int] = None,
 ) -> None:
     """Placeholder cleaning pipeline for a given quarter.
 
     The real implementation will plug in preprocessing, parsing, and output modules.
+    English-page filtering and section parsing run in up to ``max_workers``
+    processes (defaults to the CPU count); deduplication and chunk output stay
+    in the calling process, in input order.
     """
 
     resolved_input = settings.resolve_input_dir(quarter, input_dir)
     resolved_chunks = settings.resolve_clean_chunks_dir(quarter, chunks_dir)
+    run_timestamp = time.strftime("%Y%m%dT%H%M%S")
 
     LOGGER.info(
         "Starting cleaning run | quarter=%s fund=%s incremental=%s",
@@ -72,82 +104,107 @@ def run_cleaning(
     if not resolved_input.exists():
         LOGGER.warning("Input directory %s does not exist; nothing to process.", resolved_input)
     else:
-        equity_companies: List[str] = []
-        fixed_income_holdings: List[str] = []
-        for input_pdf in sorted(resolved_input.glob("*.pdf")):
-            output_pdf = clean_pdf_dir / input_pdf.name
-            filter_result = remove_english_pages(input_pdf, output_pdf)
-            LOGGER.info(
-                "Filtered %s: kept %s/%s page(s) (removed %s)",
-                input_pdf.name,
-                filter_result.kept_count,
-                filter_result.total_pages,
-                filter_result.removed_count,
-            )
-
-            cleaned_pdf = output_pdf if output_pdf.exists() else input_pdf
-            sections = parse_pdf_sections(cleaned_pdf)
-            LOGGER.info(
-                "Parsed %s into %s section(s): %s",
-                input_pdf.name,
-                len(sections.sections),
-                [section.name for section in sections.sections],
-            )
-
-            fund_meta = _derive_fund_metadata(input_pdf, fund_code)
-            chunk_index_path = settings.state_dir / "chunk_index.json"
-            dedupe_results = evaluate_sections(
-                fund_id=fund_meta.code,
-                quarter=quarter,
-                sections=sections.sections,
-                index_path=chunk_index_path,
-            )
-
-            status_counts = {"new": 0, "updated": 0, "reuse": 0}
-            for item in dedupe_results:
-                status_counts[item.status] = status_counts.get(item.status, 0) + 1
-            LOGGER.info("Section dedupe for %s: %s", fund_meta.code, status_counts)
-
-            _emit_chunks(
-                sections=sections.sections,
-                dedupe_results=dedupe_results,
-                quarter=quarter,
-                chunks_dir=settings.resolve_clean_chunks_dir(quarter, chunks_dir),
-                fund_metadata=fund_meta,
-                file_timestamp=_format_file_timestamp(input_pdf),
-                data_date=None,
-                language=_infer_language(sections.sections),
+        # Keyed by lowercased name, so only unique holdings reach the writers.
+        equity_companies: Dict[str, str] = {}
+        fixed_income_holdings: Dict[str, str] = {}
+        chunk_index_path = settings.state_dir / "chunk_index.json"
+        pdf_entries = _scan_input_pdfs(resolved_input)
+        input_pdfs = [Path(entry.path) for entry in pdf_entries]
+        workers = min(max_workers or os.cpu_count() or 1, len(input_pdfs))
+        # A non-incremental run re-extracts every page from scratch.
+        filter_cache_dir = (
+            settings.state_dir / "english_filter" / AppConfig.quarter_folder_name(quarter)
+            if incremental
+            else None
+        )
+        # The pool is closed before the index is saved and the holdings CSVs
+        # are written; if processing fails, queued PDFs are cancelled.
+        with ChunkIndex.load(chunk_index_path) as chunk_index, _extraction_pool(workers) as executor:
+            extracted_pdfs = _iter_extracted_pdfs(
+                input_pdfs,
+                clean_pdf_dir,
+                executor,
+                filter_cache_dir=filter_cache_dir,
             )
-
-            for section in sections.sections:
-                if section.name == "top_holdings":
-                    entries = extract_top_holdings_entries(section)
-                    for entry in entries:
-                        if entry.instrument_type == "fixed_income":
-                            fixed_income_holdings.append(entry.name)
-                        else:
-                            equity_companies.append(entry.name)
+            for entry, extracted in zip(pdf_entries, extracted_pdfs):
+                input_pdf = extracted.input_pdf
+                filter_result = extracted.filter_result
+                LOGGER.info(
+                    "Filtered %s: kept %s/%s page(s) (removed %s)",
+                    input_pdf.name,
+                    filter_result.kept_count,
+                    filter_result.total_pages,
+                    filter_result.removed_count,
+                )
+
+                sections = extracted.sections
+                LOGGER.info(
+                    "Parsed %s into %s section(s): %s",
+                    input_pdf.name,
+                    len(sections.sections),
+                    [section.name for section in sections.sections],
+                )
+
+                fund_meta = _derive_fund_metadata(input_pdf, fund_code)
+                # Join each section once; hashing, chunking and language
+                # inference all read the same text.
+                section_texts = [section.text for section in sections.sections]
+                dedupe_results = chunk_index.evaluate(
+                    fund_id=fund_meta.code,
+                    quarter=quarter,
+                    sections=sections.sections,
+                    texts=section_texts,
+                )
+
+                status_counts = {"new": 0, "updated": 0, "reuse": 0, "removed": 0}
+                for item in dedupe_results:
+                    status_counts[item.status] = status_counts.get(item.status, 0) + 1
+                LOGGER.info("Section dedupe for %s: %s", fund_meta.code, status_counts)
+
+                _emit_chunks(
+                    sections=sections.sections,
+                    section_texts=section_texts,
+                    dedupe_results=dedupe_results,
+                    quarter=quarter,
+                    chunks_dir=resolved_chunks,
+                    timestamp=run_timestamp,
+                    fund_metadata=fund_meta,
+                    file_timestamp=_format_file_timestamp(entry),
+                    data_date=None,
+                    language=_infer_language(section_texts),
+                    incremental=incremental,
+                )
+                # Only now does this fund's entry count as processed; if a later
+                # PDF fails, the index is still saved with it.
+                chunk_index.commit()
+
+                _collect_unique(equity_companies, extracted.equity_companies)
+                _collect_unique(fixed_income_holdings, extracted.fixed_income_holdings)
+
+        # Drop cached page text for PDFs no longer in this quarter's input.
+        if filter_cache_dir is not None:
+            prune_classification_cache(filter_cache_dir, input_pdfs)
 
         if equity_companies:
             append_top_holdings_companies(
-                companies=equity_companies,
+                companies=equity_companies.values(),
                 quarter=quarter,
                 base_dir=settings.structured_dir,
             )
             LOGGER.info(
                 "Recorded %s unique equity top-holding companies for %s",
-                len(set(equity_companies)),
+                len(equity_companies),
                 quarter,
             )
         if fixed_income_holdings:
             append_top_holdings_fixed_income(
-                holdings=fixed_income_holdings,
+                holdings=fixed_income_holdings.values(),
                 quarter=quarter,
                 base_dir=settings.structured_dir,
             )
             LOGGER.info(
                 "Recorded %s unique fixed-income holdings for %s",
-                len(set(fixed_income_holdings)),
+                len(fixed_income_holdings),
                 quarter,
             )
 
@@ -159,29 +216,141 @@ def run_cleaning(
         )
 
 
+def _extract_pdf(
+    input_pdf: Path,
+    clean_pdf_dir: Path,
+    filter_cache_dir: Optional[Path] = None,
+) -> ExtractedPdf:
+    output_pdf = clean_pdf_dir / input_pdf.name
+    filter_result = remove_english_pages(input_pdf, output_pdf, cache_dir=filter_cache_dir)
+
+    # The filter only writes output_pdf when at least one page was kept; parse
+    # the text it already extracted for those pages instead of re-reading it.
+    if filter_result.kept_pages:
+        sections = parse_page_texts(filter_result.kept_texts, output_pdf)
+    else:
+        sections = parse_pdf_sections(input_pdf)
+
+    equity_companies: List[str] = []
+    fixed_income_holdings: List[str] = []
+    for section in sections.sections:
+        if section.name == "top_holdings":
+            entries = extract_top_holdings_entries(section)
+            for entry in entries:
+                if entry.instrument_type == "fixed_income":
+                    fixed_income_holdings.append(entry.name)
+                else:
+                    equity_companies.append(entry.name)
+
+    return ExtractedPdf(
+        input_pdf=input_pdf,
+        filter_result=filter_result,
+        sections=sections,
+        equity_companies=equity_companies,
+        fixed_income_holdings=fixed_income_holdings,
+    )
+
+
+@contextmanager
+def _extraction_pool(
+    workers: int,
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator[Optional[ProcessPoolExecutor]]:
+    """Yield a process pool for ``workers`` > 1, or ``None`` to extract inline."""
+
+    if workers <= 1:
+        yield None
+        return
+
+    context = mp_context or multiprocessing.get_context()
+    # Workers log through a queue into this process's handlers, whatever the
+    # start method; the listener outlives the pool so no record is dropped.
+    with forward_worker_logging(context) as log_queue:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=init_worker_logging,
+            initargs=(log_queue, logging.getLogger().getEffectiveLevel()),
+        )
+        try:
+            yield executor
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+
+def _iter_extracted_pdfs(
+    input_pdfs: Sequence[Path],
+    clean_pdf_dir: Path,
+    executor: Optional[ProcessPoolExecutor],
+    filter_cache_dir: Optional[Path] = None,
+) -> Iterator[ExtractedPdf]:
+    if executor is None:
+        for input_pdf in input_pdfs:
+            yield _extract_pdf(input_pdf, clean_pdf_dir, filter_cache_dir)
+        return
+
+    extract = partial(
+        _extract_pdf,
+        clean_pdf_dir=clean_pdf_dir,
+        filter_cache_dir=filter_cache_dir,
+    )
+    yield from executor.map(extract, input_pdfs)
+
+
 def _emit_chunks(
     *,
     sections: Sequence[PdfSection],
+    section_texts: Sequence[str],
     dedupe_results: List[SectionHashResult],
     quarter: str,
     chunks_dir: Path,
+    timestamp: str,
     fund_metadata: FundMetadata,
     file_timestamp: str,
     data_date: Optional[str],
     language: str,
     chunk_size: int = 600,
     overlap: int = 80,
+    incremental: bool = True,
 ) -> None:
-    chunks_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
-    filename = f"{fund_metadata.name}_{fund_metadata.code}_{quarter}_{timestamp}.json"
-    output_path = chunks_dir / filename
+    # Only a same-quarter re-run may skip output: a new quarter that reuses the
+    # previous quarter's sections still gets its own file for the archive. Any
+    # removed section, or a missing earlier file in chunks_dir, means the
+    # latest output no longer matches and is written again.
+    prefix = f"{fund_metadata.name}_{fund_metadata.code}_{quarter}"
+    if (
+        incremental
+        and dedupe_results
+        and all(
+            result.status == "reuse" and result.compared_quarter == quarter
+            for result in dedupe_results
+        )
+        and any(chunks_dir.glob(f"{glob.escape(prefix)}_*.jsonl"))
+    ):
+        LOGGER.info(
+            "All sections unchanged since the last %s run for %s; skipping chunk emission",
+            quarter,
+            fund_metadata.code,
+        )
+        return
+
+    # The timestamp is shared by the whole run, so funds that resolve to the
+    # same name/code (e.g. with an override code) get a numeric suffix.
+    stem = f"{prefix}_{timestamp}"
+    output_path = chunks_dir / f"{stem}.jsonl"
+    suffix = 1
+    while output_path.exists():
+        output_path = chunks_dir / f"{stem}_{suffix}.jsonl"
+        suffix += 1
 
     status_map = {result.key: result for result in dedupe_results}
 
-    entries = []
+    prepared = []
+    unique_texts: Dict[str, None] = {}
 
-    for idx, section in enumerate(sections):
+    for idx, (section, text) in enumerate(zip(sections, section_texts)):
         key = f"{section.name}:{idx}"
         result = status_map.get(key)
         summary = None
@@ -208,45 +377,63 @@ def _emit_chunks(
 
         chunks = chunk_section_text(
             section.name,
-            section.text,
+            text,
             chunk_size=chunk_size,
             overlap=overlap,
         )
 
         if summary:
-            summary_entry = {
-                **summary_entry_base,
-                "type": "summary",
-                "text": summary,
-                "change_type": result.status if result else "unknown",
-                "chunk_index": None,
-                "chunk_hash": compute_hash(summary),
-                "start_offset": None,
-                "end_offset": None,
-                "structured_refs": [],
-            }
-            entries.append(
-                summary_entry
+            unique_texts[summary] = None
+        unique_texts.update(dict.fromkeys(chunk.text for chunk in chunks))
+        prepared.append((result, summary, summary_entry_base, chunks))
+
+    # Hash each distinct summary/chunk body once, in one batch, before building
+    # entries; overlapping windows and boilerplate sections often repeat text.
+    hash_cache = dict(zip(unique_texts, compute_hashes(unique_texts)))
+
+    entries = []
+
+    for result, summary, summary_entry_base, chunks in prepared:
+        change_type = result.status if result else "unknown"
+
+        if summary:
+            summary_entry = summary_entry_base.copy()
+            summary_entry.update(
+                {
+                    "type": "summary",
+                    "text": summary,
+                    "change_type": change_type,
+                    "chunk_index": None,
+                    "chunk_hash": hash_cache[summary],
+                    "start_offset": None,
+                    "end_offset": None,
+                    "structured_refs": [],
+                }
             )
+            entries.append(summary_entry)
 
         for chunk in chunks:
-            chunk_entry = {
-                **summary_entry_base,
-                "type": "chunk",
-                "chunk_index": chunk.index,
-                "chunk_hash": compute_hash(chunk.text),
-                "change_type": result.status if result else "unknown",
-                "text": chunk.text,
-                "start_offset": chunk.start_offset,
-                "end_offset": chunk.end_offset,
-                "structured_refs": [],
-            }
-            entries.append(
-                chunk_entry
+            chunk_entry = summary_entry_base.copy()
+            chunk_entry.update(
+                {
+                    "type": "chunk",
+                    "chunk_index": chunk.index,
+                    "chunk_hash": hash_cache[chunk.text],
+                    "change_type": change_type,
+                    "text": chunk.text,
+                    "start_offset": chunk.start_offset,
+                    "end_offset": chunk.end_offset,
+                    "structured_refs": [],
+                }
             )
+            entries.append(chunk_entry)
 
-    with output_path.open("w", encoding="utf-8") as handle:
-        json.dump(entries, handle, ensure_ascii=False, indent=2)
+    # One JSON object per line, written to a sibling file and moved into place
+    # so downstream consumers of the chunk directory never see a partial file.
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.writelines(orjson.dumps(entry) + b"\n" for entry in entries)
+    tmp_path.replace(output_path)
 
     LOGGER.info("Wrote %s chunk entries to %s", len(entries), output_path.name)
 
@@ -294,9 +481,28 @@ def _split_name_code(stem: str) -> tuple[str, str]:
     return stem, stem
 
 
-def _format_file_timestamp(pdf_path: Path) -> str:
+def _collect_unique(seen: Dict[str, str], values: Sequence[str]) -> None:
+    for value in values:
+        normalized = value.strip()
+        if normalized:
+            seen.setdefault(normalized.lower(), normalized)
+
+
+def _scan_input_pdfs(input_dir: Path) -> List[os.DirEntry]:
+    with os.scandir(input_dir) as entries:
+        pdf_entries = [
+            entry
+            for entry in entries
+            if entry.name.lower().endswith(".pdf") and entry.is_file()
+        ]
+    pdf_entries.sort(key=lambda entry: entry.name)
+    return pdf_entries
+
+
+def _format_file_timestamp(entry: os.DirEntry) -> str:
     try:
-        mtime = pdf_path.stat().st_mtime
+        # DirEntry caches its stat result, so each PDF is stat()ed at most once.
+        mtime = entry.stat().st_mtime
     except OSError:
         return datetime.now(timezone.utc).isoformat()
     return datetime.fromtimestamp(mtime, timezone.utc).isoformat()
@@ -340,13 +546,16 @@ def _base_metadata_entry(
     }
 
 
-def _infer_language(sections: Sequence[PdfSection]) -> str:
+def _infer_language(texts: Iterable[str]) -> str:
     total_chars = 0
     ascii_chars = 0
-    for section in sections:
-        text = section.text
+    for text in texts:
         total_chars += len(text)
-        ascii_chars += sum(1 for ch in text if ch.isascii())
+        if text.isascii():
+            ascii_chars += len(text)
+        else:
+            # Encoding drops every non-ASCII character in a single C-level pass.
+            ascii_chars += len(text.encode("ascii", errors="ignore"))
     if not total_chars:
         return "unknown"
     ratio = ascii_chars / total_chars
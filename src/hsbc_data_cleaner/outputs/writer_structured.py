@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import csv
+import re
 from pathlib import Path
 from typing import Dict, Iterable
 
@@ -33,7 +34,19 @@ def append_top_holdings_fixed_income(
     _append_unique_strings(csv_path, "security_name", holdings)
 
 
-def _append_unique_strings(csv_path: Path, header: str, values: Iterable[str]) -> None:
+def compact_top_holdings(base_dir: Path) -> None:
+    """Rewrite the top-holdings CSVs fully sorted (case-insensitive).
+
+    Appends only add rows at the end of each file; this restores a single
+    sorted list on demand.
+    """
+
+    base_dir = Path(base_dir)
+    _compact_unique_strings(base_dir / "top_holdings_companies.csv", "company_name")
+    _compact_unique_strings(base_dir / "top_holdings_bonds.csv", "security_name")
+
+
+def _read_unique_strings(csv_path: Path, header: str) -> Dict[str, str]:
     existing: Dict[str, str] = {}
     if csv_path.exists():
         with csv_path.open("r", newline="", encoding="utf-8") as handle:
@@ -42,24 +55,54 @@ def _append_unique_strings(csv_path: Path, header: str, values: Iterable[str]) -
                 value = (row.get(header) or "").strip()
                 if value:
                     existing[value.lower()] = value
+    return existing
+
+
+def _append_unique_strings(csv_path: Path, header: str, values: Iterable[str]) -> None:
+    existing = _read_unique_strings(csv_path, header)
 
-    updated = False
+    added: Dict[str, str] = {}
     for value in values:
         normalized = value.strip()
         if not normalized:
             continue
         key = normalized.lower()
-        if key in existing:
+        if key in existing or key in added:
             continue
-        existing[key] = normalized
-        updated = True
+        added[key] = normalized
 
-    if not updated:
+    if not added:
         return
 
-    sorted_names = sorted(existing.values(), key=lambda x: x.lower())
-    with csv_path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.writer(handle)
-        writer.writerow([header])
-        for item in sorted_names:
-            writer.writerow([item])
+    # Only the new rows are written; existing rows are never rewritten.
+    new_file = not csv_path.exists() or csv_path.stat().st_size == 0
+    rows = [value for _, value in sorted(added.items())]
+    if new_file:
+        rows.insert(0, header)
+    with csv_path.open("ab") as handle:
+        handle.write(_encode_csv_column(rows))
+
+
+def _compact_unique_strings(csv_path: Path, header: str) -> None:
+    existing = _read_unique_strings(csv_path, header)
+    if not existing:
+        return
+
+    # Keys are already the lowercased values, so sorting items needs no key func.
+    sorted_names = [value for _, value in sorted(existing.items())]
+    tmp_path = csv_path.with_suffix(csv_path.suffix + ".tmp")
+    tmp_path.write_bytes(_encode_csv_column([header, *sorted_names]))
+    tmp_path.replace(csv_path)
+
+
+_CSV_SPECIAL_PATTERN = re.compile(r'[,"\r\n]')
+
+
+def _encode_csv_column(values: Iterable[str]) -> bytes:
+    """Encode single-column rows exactly as ``csv.writer`` would, in one pass."""
+
+    fields = [
+        '"' + value.replace('"', '""') + '"' if _CSV_SPECIAL_PATTERN.search(value) else value
+        for value in values
+    ]
+    return ("\r\n".join(fields) + "\r\n").encode("utf-8")
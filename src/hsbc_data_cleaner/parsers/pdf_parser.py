@@ -15,7 +15,7 @@ LOGGER = logging.getLogger(__name__)
 from ..cleaning.normalizers import normalize_lines
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectionDefinition:
     """Definition of a section heading (supports multilingual patterns)."""
 
@@ -23,17 +23,17 @@ class SectionDefinition:
     patterns: Sequence[re.Pattern[str]]
 
 
-DEFAULT_SECTION_DEFINITIONS: Sequence[SectionDefinition] = [
+DEFAULT_SECTION_DEFINITIONS: Sequence[SectionDefinition] = (
     SectionDefinition(
         name="important_information",
-        patterns=[
+        patterns=(
             re.compile(r"important\s+information", re.IGNORECASE),
             re.compile(r"重要事項"),
-        ],
+        ),
     ),
     SectionDefinition(
         name="top_holdings",
-        patterns=[
+        patterns=(
             re.compile(r"top\s+10\s+holdings", re.IGNORECASE),
             re.compile(r"十大持股"),
             re.compile(r"十大持倉"),
@@ -43,46 +43,46 @@ DEFAULT_SECTION_DEFINITIONS: Sequence[SectionDefinition] = [
             re.compile(r"十+大+.*持+股+"),
             re.compile(r"十+大+.*持+倉+"),
             re.compile(r"十大投資項目"),
-        ],
+        ),
     ),
     SectionDefinition(
         name="performance",
-        patterns=[
+        patterns=(
             re.compile(r"calendar\s+year\s+returns", re.IGNORECASE),
             re.compile(r"年度回報"),
             re.compile(r"累積回報"),
-        ],
+        ),
     ),
     SectionDefinition(
         name="product_summary",
-        patterns=[
+        patterns=(
             re.compile(r"product\s+key\s+facts", re.IGNORECASE),
             re.compile(r"產品資料概要"),
-        ],
+        ),
     ),
     SectionDefinition(
         name="objective_strategy",
-        patterns=[
+        patterns=(
             re.compile(r"objective[s]?\s+and\s+investment\s+strategy", re.IGNORECASE),
             re.compile(r"目標及投資策略"),
-        ],
+        ),
     ),
     SectionDefinition(
         name="fees_charges",
-        patterns=[
+        patterns=(
             re.compile(r"fees?\s+and\s+charges", re.IGNORECASE),
             re.compile(r"費用"),
             re.compile(r"費用及開支"),
-        ],
+        ),
     ),
     SectionDefinition(
         name="other_information",
-        patterns=[
+        patterns=(
             re.compile(r"other\s+information", re.IGNORECASE),
             re.compile(r"其他資料"),
-        ],
+        ),
     ),
-]
+)
 
 SECTOR_NAMES = [
     "Information Technology",
@@ -106,11 +106,39 @@ _SECTOR_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Lines that end the holdings table.
+_STOP_KEYWORDS = (
+    "投資組合",
+    "組合分布",
+    "組合分佈",
+    "類別分布",
+    "類別分佈",
+    "股票特點",
+    "固定收益特點",
+    "行業分佈",
+    "行業分布",
+    "滙豐集合",
+    "月度報告",
+    "有關詞彙",
+    "重要資訊",
+    "關注我們",
+)
+# Lines (e.g. QR-code prompts) that interrupt a holding without ending the table.
+_SKIP_KEYWORDS = ("查閱", "請掃描")
+_STOP_KEYWORD_PATTERN = re.compile("|".join(re.escape(k) for k in _STOP_KEYWORDS))
+_SKIP_KEYWORD_PATTERN = re.compile("|".join(re.escape(k) for k in _SKIP_KEYWORDS))
+
+# Lowercase header keywords used to classify holdings tables.
+_HEADER_TOKENS = ("持倉", "持仓", "holdings", "holding")
+_FIXED_INCOME_HEADER_KEYWORDS = ("固定收益", "fixed income", "債券", "债券", "bond")
+_EQUITY_HEADER_KEYWORDS = ("股票", "equity")
+
 _VALUE_AT_END_PATTERN = re.compile(r"([0-9]+(?:\.[0-9]+)?)%?$")
+_VALUE_END_CHARS = frozenset("0123456789%")
 _CHINESE_CHAR_PATTERN = re.compile(r"[\u4e00-\u9fff]")
 
 
-@dataclass
+@dataclass(slots=True)
 class PdfSection:
     """Parsed section content with metadata."""
 
@@ -146,7 +174,7 @@ class ParseResult:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TopHoldingEntry:
     """Individual holding extracted from a top-holdings section."""
 
@@ -163,18 +191,35 @@ def parse_pdf_sections(
     pdf_path = Path(pdf_path)
     reader = PdfReader(str(pdf_path))
 
-    sections: List[PdfSection] = []
-    current_section = PdfSection(name="document_intro", title="Document Introduction")
-
-    for page_index, page in enumerate(reader.pages, start=1):
+    page_texts: List[str] = []
+    for page in reader.pages:
         try:
-            page_text = page.extract_text() or ""
+            page_texts.append(page.extract_text() or "")
         except Exception:  # pragma: no cover - best-effort extraction
-            page_text = ""
+            page_texts.append("")
+
+    return parse_page_texts(page_texts, pdf_path, section_definitions)
+
+
+def parse_page_texts(
+    page_texts: Sequence[str],
+    input_path: Path,
+    section_definitions: Sequence[SectionDefinition] = DEFAULT_SECTION_DEFINITIONS,
+) -> ParseResult:
+    """Parse already-extracted page texts (page 1 first) into coarse sections."""
 
+    input_path = Path(input_path)
+    if section_definitions is DEFAULT_SECTION_DEFINITIONS:
+        matcher = _DEFAULT_MATCHER
+    else:
+        matcher = _SectionMatcher.build(section_definitions)
+    sections: List[PdfSection] = []
+    current_section = PdfSection(name="document_intro", title="Document Introduction")
+
+    for page_index, page_text in enumerate(page_texts, start=1):
         lines = normalize_lines(page_text.splitlines())
         for line in lines:
-            matched_def = _match_section(line, section_definitions)
+            matched_def = _match_section(line, matcher)
             if matched_def:
                 if current_section.lines:
                     sections.append(current_section)
@@ -187,23 +232,26 @@ def parse_pdf_sections(
                 continue
 
             current_section.lines.append(line)
-            if page_index not in current_section.pages:
-                current_section.pages.append(page_index)
+            # Pages are visited in order, so only the last entry can be a repeat.
+            pages = current_section.pages
+            if not pages or pages[-1] != page_index:
+                pages.append(page_index)
 
     if current_section.lines or current_section.name != "document_intro":
         sections.append(current_section)
 
-    LOGGER.debug(
-        "Parsed %s into %s section(s): %s",
-        pdf_path.name,
-        len(sections),
-        [section.name for section in sections],
-    )
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            "Parsed %s into %s section(s): %s",
+            input_path.name,
+            len(sections),
+            [section.name for section in sections],
+        )
 
     return ParseResult(
-        input_path=pdf_path,
+        input_path=input_path,
         sections=sections,
-        total_pages=len(reader.pages),
+        total_pages=len(page_texts),
     )
 
 
@@ -211,30 +259,15 @@ def extract_top_holdings_entries(section: PdfSection) -> List[TopHoldingEntry]:
     """Extract top holdings entries with instrument classification."""
 
     entries: List[TopHoldingEntry] = []
-    stop_keywords = (
-        "投資組合",
-        "組合分布",
-        "組合分佈",
-        "類別分布",
-        "類別分佈",
-        "股票特點",
-        "固定收益特點",
-        "行業分佈",
-        "行業分布",
-        "滙豐集合",
-        "月度報告",
-        "有關詞彙",
-        "重要資訊",
-        "關注我們",
+    # Whitespace-normalized holding text accumulated across wrapped lines.
+    candidate = ""
+    current_type: Optional[str] = _infer_type_from_title(
+        section.title.lower() if section.title else None
     )
-    buffer: List[str] = []
-    current_type: Optional[str] = _infer_type_from_title(section.title)
 
-    def _flush_buffer() -> None:
-        if not buffer:
+    def _flush_candidate() -> None:
+        if not candidate:
             return
-        candidate = " ".join(buffer).strip()
-        candidate = re.sub(r"\s+", " ", candidate)
         match = _VALUE_AT_END_PATTERN.search(candidate)
         if not match or match.end() != len(candidate):
             return
@@ -267,30 +300,30 @@ def extract_top_holdings_entries(section: PdfSection) -> List[TopHoldingEntry]:
             continue
         if lowered.startswith("total") or "合共" in text:
             continue
-        title_type = _infer_type_from_title(text)
+        title_type = _infer_type_from_title(lowered)
         if title_type:
-            _flush_buffer()
-            buffer = []
+            _flush_candidate()
+            candidate = ""
             current_type = title_type
             continue
-        if any(keyword in text for keyword in ("查閱", "請掃描")):
-            _flush_buffer()
-            buffer = []
+        if _SKIP_KEYWORD_PATTERN.search(text):
+            _flush_candidate()
+            candidate = ""
             continue
-        if any(keyword in text for keyword in stop_keywords):
-            _flush_buffer()
-            buffer = []
+        if _STOP_KEYWORD_PATTERN.search(text):
+            _flush_candidate()
+            candidate = ""
             break
 
-        buffer.append(text)
-        candidate = " ".join(buffer)
-        candidate = re.sub(r"\s+", " ", candidate)
-        match = _VALUE_AT_END_PATTERN.search(candidate)
-        if match and match.end() == len(candidate):
-            _flush_buffer()
-            buffer = []
+        text = " ".join(text.split())
+        candidate = f"{candidate} {text}" if candidate else text
+        # A trailing value has no spaces, so it can only sit in the newest line;
+        # skip the regex unless that line could end in one.
+        if text[-1] in _VALUE_END_CHARS and _VALUE_AT_END_PATTERN.search(text):
+            _flush_candidate()
+            candidate = ""
 
-    _flush_buffer()
+    _flush_candidate()
     return entries
 
 
@@ -304,16 +337,16 @@ def extract_top_holdings_companies(section: PdfSection) -> List[str]:
     ]
 
 
-def _infer_type_from_title(title: Optional[str]) -> Optional[str]:
-    if not title:
+def _infer_type_from_title(title_lower: Optional[str]) -> Optional[str]:
+    """Classify a holdings table header; expects already-lowercased text."""
+
+    if not title_lower:
         return None
-    normalized = title.lower()
-    header_tokens = ("持倉", "持仓", "holdings", "holding")
-    if not any(token in normalized for token in header_tokens):
+    if not any(token in title_lower for token in _HEADER_TOKENS):
         return None
-    if any(keyword in normalized for keyword in ("固定收益", "fixed income", "債券", "债券", "bond")):
+    if any(keyword in title_lower for keyword in _FIXED_INCOME_HEADER_KEYWORDS):
         return "fixed_income"
-    if any(keyword in normalized for keyword in ("股票", "equity")):
+    if any(keyword in title_lower for keyword in _EQUITY_HEADER_KEYWORDS):
         return "equity"
     return None
 
@@ -338,26 +371,20 @@ def _infer_type_from_name(name: str) -> Optional[str]:
     return None
 
 
-def _contains_cjk(text: str) -> bool:
-    return bool(_CHINESE_CHAR_PATTERN.search(text))
-
-
 def _clean_company_name(raw: str) -> str:
     """Trim trailing region/sector metadata from a holdings string."""
 
-    normalized = re.sub(r"\s+", " ", raw).strip()
-    if not normalized:
+    tokens = raw.split()
+    if not tokens:
         return ""
+    normalized = " ".join(tokens)
 
-    tokens = normalized.split()
-    primary: List[str] = []
-    for token in tokens:
-        if _contains_cjk(token) and primary:
-            break
-        primary.append(token)
-
-    cleaned = " ".join(primary).strip()
-    return cleaned or normalized
+    # Keep everything before the first token (after the leading one) that
+    # contains CJK text; one search from the end of the first token finds it.
+    match = _CHINESE_CHAR_PATTERN.search(normalized, len(tokens[0]))
+    if match is None:
+        return normalized
+    return normalized[: normalized.rfind(" ", 0, match.start())]
 
 
 def _prepare_lines(lines: Iterable[str]) -> List[str]:
@@ -370,13 +397,59 @@ def _prepare_lines(lines: Iterable[str]) -> List[str]:
     return cleaned
 
 
-def _match_section(line: str, definitions: Sequence[SectionDefinition]) -> Optional[SectionDefinition]:
+@dataclass(frozen=True)
+class _SectionMatcher:
+    """Section heading patterns with a combined single-pass pre-check."""
+
+    definitions: Sequence[SectionDefinition]
+    combined: Optional[re.Pattern[str]]
+
+    @classmethod
+    def build(cls, definitions: Sequence[SectionDefinition]) -> "_SectionMatcher":
+        patterns = [pattern for definition in definitions for pattern in definition.patterns]
+        combined = None
+        # Patterns with their own groups (e.g. backreferences) could break once
+        # merged, and inline global flags such as "(?i)" are rejected inside a
+        # group; those definitions keep the per-pattern scan only.
+        if patterns and not any(pattern.groups for pattern in patterns):
+            try:
+                combined = re.compile("|".join(_scoped_pattern(pattern) for pattern in patterns))
+            except re.error:
+                combined = None
+        return cls(definitions=definitions, combined=combined)
+
+    def match(self, line: str) -> Optional[SectionDefinition]:
+        # Most lines are not headings: one combined search rejects them. On a
+        # hit, the ordered scan decides, since the first matching definition
+        # wins rather than the leftmost match in the line.
+        if self.combined is not None and not self.combined.search(line):
+            return None
+        for definition in self.definitions:
+            for pattern in definition.patterns:
+                if pattern.search(line):
+                    return definition
+        return None
+
+
+_SCOPED_FLAGS = ((re.ASCII, "a"), (re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+
+def _scoped_pattern(pattern: re.Pattern[str]) -> str:
+    """Return pattern source wrapped so its flags survive being merged."""
+
+    source = pattern.pattern
+    if pattern.flags & re.VERBOSE:
+        source = f"(?x:{source}\n)"
+    flags = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+    return f"(?{flags}:{source})" if flags else f"(?:{source})"
+
+
+# The default definitions are immutable, so their matcher is compiled once.
+_DEFAULT_MATCHER = _SectionMatcher.build(DEFAULT_SECTION_DEFINITIONS)
+
+
+def _match_section(line: str, matcher: _SectionMatcher) -> Optional[SectionDefinition]:
     normalized = line.strip()
     if not normalized:
         return None
-
-    for definition in definitions:
-        for pattern in definition.patterns:
-            if pattern.search(normalized):
-                return definition
-    return None
+    return matcher.match(normalized)
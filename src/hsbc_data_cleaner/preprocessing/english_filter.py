@@ -2,15 +2,44 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from dataclasses import dataclass
+import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from importlib import metadata
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import orjson
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import NameObject
+
+try:  # Optional native text extraction backend
+    import pypdfium2 as pdfium  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - falls back to pypdf
+    pdfium = None
 
 LOGGER = logging.getLogger(__name__)
 
+# CJK counting works on runs of characters, which keeps the per-character
+# work inside the regex engine.
+_CJK_RUN_PATTERN = re.compile(r"[\u4e00-\u9fff]+")
+# ASCII letters are counted on the ASCII-encoded text by deleting every other
+# byte value in a single C-level translate.
+_NON_LETTER_BYTES = bytes(sorted(set(range(256)) - set(string.ascii_letters.encode("ascii"))))
+
+# CID orderings of the Adobe CJK character collections.
+_CJK_CID_ORDERINGS = frozenset({"GB1", "CNS1", "Japan1", "Korea1"})
+# Simple fonts that, with a named encoding and no ToUnicode map, only
+# ever decode to single-byte (non-CJK) text.
+_SIMPLE_FONT_SUBTYPES = frozenset({"/Type1", "/MMType1", "/TrueType"})
+
+# Bump when the cached classification format or heuristic changes.
+_CACHE_VERSION = 1
+
 
 @dataclass
 class EnglishFilterResult:
@@ -21,6 +50,8 @@ class EnglishFilterResult:
     kept_pages: Sequence[int]
     removed_pages: Sequence[int]
     total_pages: int
+    # Extracted text of each kept page, aligned with ``kept_pages``.
+    kept_texts: Sequence[str] = field(default=(), repr=False)
 
     @property
     def removed_count(self) -> int:
@@ -37,6 +68,9 @@ def remove_english_pages(
     *,
     chinese_threshold: int = 10,
     ascii_ratio_threshold: float = 0.8,
+    workers: Optional[int] = None,
+    classifier: Optional[Callable[[str], bool]] = None,
+    cache_dir: Optional[Path] = None,
 ) -> EnglishFilterResult:
     """Remove pages that appear to be primarily English text.
 
@@ -48,31 +82,61 @@ def remove_english_pages(
         ascii_ratio_threshold: When Chinese characters are below threshold,
             classify as English if ASCII letters make up at least this ratio of
             total letters. Value should be between 0 and 1.
+        workers: Extract page text in this many processes, each handling a
+            contiguous page range. Defaults to a single in-process pass, which
+            suits callers that already parallelise across PDFs. Ignored when
+            the pypdfium2 backend extracts the text, since it does so natively.
+        classifier: Optional callable given each page's text that returns
+            True for pages to keep (e.g. a language-ID model). Replaces the
+            CJK/ASCII heuristic, so both thresholds are then ignored.
+        cache_dir: Directory for per-PDF classification results (including
+            kept page text), reused while the file's mtime, size and the
+            thresholds are unchanged. Not used with a custom classifier.
+
+    Page text comes from pypdfium2 when it is installed and from pypdf
+    otherwise, or when pypdfium2 cannot open the file or counts a different
+    number of pages; pypdf always writes the filtered PDF.
     """
 
     pdf_path = Path(pdf_path)
-    reader = PdfReader(str(pdf_path))
+    output_path = Path(output_path) if output_path else None
+    pdf_name = pdf_path.name
+    reader: Optional[PdfReader] = None
 
-    kept_pages: List[int] = []
-    removed_pages: List[int] = []
+    cache_path: Optional[Path] = None
+    cache_key: Dict[str, object] = {}
+    cached = None
+    if cache_dir is not None and classifier is None:
+        cache_path = _cache_path(Path(cache_dir), pdf_path)
+        cache_key = _cache_key(pdf_path, chinese_threshold, ascii_ratio_threshold)
+        cached = _load_cached_classification(cache_path, cache_key)
 
-    for page_index, page in enumerate(reader.pages, start=1):
-        try:
-            text = page.extract_text() or ""
-        except Exception:  # pragma: no cover - pypdf best-effort extraction
-            text = ""
-
-        if _is_chinese_dominant(text, chinese_threshold, ascii_ratio_threshold):
-            kept_pages.append(page_index)
-        else:
-            removed_pages.append(page_index)
+    if cached is not None:
+        kept_pages, removed_pages, kept_texts, total_pages = cached
+    else:
+        reader = PdfReader(str(pdf_path))
+        total_pages = len(reader.pages)
+        kept_pages, removed_pages, kept_texts = _classify_pages(
+            pdf_path,
+            reader,
+            total_pages,
+            chinese_threshold=chinese_threshold,
+            ascii_ratio_threshold=ascii_ratio_threshold,
+            workers=workers,
+            classifier=classifier,
+        )
+        if cache_path is not None:
+            _save_cached_classification(
+                cache_path, cache_key, kept_pages, removed_pages, kept_texts, total_pages
+            )
 
     if output_path and kept_pages:
+        if reader is None:
+            reader = PdfReader(str(pdf_path))
         writer = PdfWriter()
         for index in kept_pages:
             writer.add_page(reader.pages[index - 1])
 
-        output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with output_path.open("wb") as handle:
             writer.write(handle)
@@ -83,34 +147,310 @@ def remove_english_pages(
         )
     elif output_path:
         LOGGER.warning(
-            "All pages classified as English in %s; no file written.", pdf_path.name
+            "All pages classified as English in %s; no file written.", pdf_name
         )
 
-    if removed_pages:
+    if removed_pages and LOGGER.isEnabledFor(logging.DEBUG):
         LOGGER.debug(
-            "Removed English pages %s from %s", list(removed_pages), pdf_path.name
+            "Removed English pages %s from %s", list(removed_pages), pdf_name
         )
 
     return EnglishFilterResult(
         input_path=pdf_path,
-        output_path=Path(output_path) if output_path else None,
+        output_path=output_path,
         kept_pages=kept_pages,
         removed_pages=removed_pages,
-        total_pages=len(reader.pages),
+        total_pages=total_pages,
+        kept_texts=kept_texts,
     )
 
 
+def _classify_pages(
+    pdf_path: Path,
+    reader: PdfReader,
+    total_pages: int,
+    *,
+    chinese_threshold: int,
+    ascii_ratio_threshold: float,
+    workers: Optional[int],
+    classifier: Optional[Callable[[str], bool]],
+) -> Tuple[List[int], List[int], List[str]]:
+    kept_pages: List[int] = []
+    kept_texts: List[str] = []
+    removed_pages: List[int] = []
+
+    if classifier is None:
+        classifier = partial(
+            _is_chinese_dominant,
+            chinese_threshold=chinese_threshold,
+            ascii_ratio_threshold=ascii_ratio_threshold,
+        )
+        # A page without CJK text is always removed under these thresholds, so
+        # scans and pages whose fonts cannot produce CJK text need not be
+        # extracted.
+        skip_latin_only = chinese_threshold > 0 and ascii_ratio_threshold <= 1
+    else:
+        skip_latin_only = False
+    page_texts: Optional[Sequence[Optional[str]]] = None
+    if pdfium is not None:
+        page_texts = _extract_page_texts_pdfium(pdf_path, total_pages)
+    if page_texts is None:
+        if workers and workers > 1 and total_pages > 1:
+            page_texts = _extract_page_texts_parallel(
+                pdf_path, total_pages, workers, skip_latin_only
+            )
+        else:
+            page_texts = [_extract_page_text(page, skip_latin_only) for page in reader.pages]
+
+    for page_index, text in enumerate(page_texts, start=1):
+        if text is not None and classifier(text):
+            kept_pages.append(page_index)
+            kept_texts.append(text)
+        else:
+            removed_pages.append(page_index)
+    return kept_pages, removed_pages, kept_texts
+
+
+def prune_classification_cache(cache_dir: Path, pdf_paths: Iterable[Path]) -> int:
+    """Delete cached classifications for PDFs other than ``pdf_paths``.
+
+    Returns the number of cache files removed.
+    """
+
+    cache_dir = Path(cache_dir)
+    if not cache_dir.is_dir():
+        return 0
+    keep = {_cache_path(cache_dir, Path(pdf_path)).name for pdf_path in pdf_paths}
+    removed = 0
+    for cache_file in cache_dir.glob("*.json"):
+        if cache_file.name not in keep:
+            cache_file.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def _cache_path(cache_dir: Path, pdf_path: Path) -> Path:
+    digest = hashlib.sha1(str(pdf_path.resolve()).encode("utf-8")).hexdigest()
+    return cache_dir / f"{digest}.json"
+
+
+def _cache_key(
+    pdf_path: Path,
+    chinese_threshold: int,
+    ascii_ratio_threshold: float,
+) -> Dict[str, object]:
+    stat = pdf_path.stat()
+    return {
+        "version": _CACHE_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "chinese_threshold": chinese_threshold,
+        "ascii_ratio_threshold": ascii_ratio_threshold,
+        # The two backends, and releases of each, can extract slightly
+        # different text; pypdf is always involved (fallback and writer).
+        "backend": "pdfium" if pdfium is not None else "pypdf",
+        "pypdf": _library_version("pypdf"),
+        "pypdfium2": _library_version("pypdfium2") if pdfium is not None else None,
+    }
+
+
+@lru_cache(maxsize=None)
+def _library_version(distribution: str) -> Optional[str]:
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:  # pragma: no cover - e.g. vendored copies
+        return None
+
+
+def _load_cached_classification(
+    cache_path: Path,
+    key: Dict[str, object],
+) -> Optional[Tuple[List[int], List[int], List[str], int]]:
+    try:
+        data = orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("key") != key:
+        return None
+    return data["kept_pages"], data["removed_pages"], data["kept_texts"], data["total_pages"]
+
+
+def _save_cached_classification(
+    cache_path: Path,
+    key: Dict[str, object],
+    kept_pages: List[int],
+    removed_pages: List[int],
+    kept_texts: List[str],
+    total_pages: int,
+) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "key": key,
+        "kept_pages": kept_pages,
+        "removed_pages": removed_pages,
+        "kept_texts": kept_texts,
+        "total_pages": total_pages,
+    }
+    tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(payload))
+    tmp_path.replace(cache_path)
+
+
+def _extract_page_text(page, skip_latin_only: bool = False) -> Optional[str]:
+    """Return the page text, or None when its resources rule out CJK text."""
+
+    if skip_latin_only and (_looks_like_scan(page) or _page_uses_cjk_fonts(page) is False):
+        return None
+    try:
+        return page.extract_text() or ""
+    except Exception:  # pragma: no cover - pypdf best-effort extraction
+        return ""
+
+
+def _extract_page_texts_pdfium(pdf_path: Path, total_pages: int) -> Optional[List[str]]:
+    """Return per-page text from PDFium, or None to fall back to pypdf."""
+
+    try:
+        document = pdfium.PdfDocument(str(pdf_path))
+    except Exception as exc:  # pragma: no cover - depends on the PDF
+        LOGGER.warning("pypdfium2 could not open %s (%s); using pypdf", pdf_path.name, exc)
+        return None
+    page_texts: List[str] = []
+    try:
+        # Page numbers index the pypdf reader that writes the output, so the
+        # two backends must agree on the page count.
+        if len(document) != total_pages:
+            LOGGER.warning(
+                "pypdfium2 found %s page(s) in %s but pypdf found %s; using pypdf",
+                len(document),
+                pdf_path.name,
+                total_pages,
+            )
+            return None
+        for index in range(total_pages):
+            page = document[index]
+            try:
+                textpage = page.get_textpage()
+                try:
+                    # PDFium separates lines with CRLF; pypdf and the parser use LF.
+                    page_texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+                finally:
+                    textpage.close()
+            except Exception:  # pragma: no cover - best-effort extraction
+                page_texts.append("")
+            finally:
+                page.close()
+    finally:
+        document.close()
+    return page_texts
+
+
+def _extract_page_range(
+    pdf_path: Path,
+    page_range: Tuple[int, int],
+    skip_latin_only: bool = False,
+) -> List[Optional[str]]:
+    start, stop = page_range
+    reader = PdfReader(str(pdf_path))
+    return [_extract_page_text(reader.pages[index], skip_latin_only) for index in range(start, stop)]
+
+
+def _extract_page_texts_parallel(
+    pdf_path: Path,
+    total_pages: int,
+    workers: int,
+    skip_latin_only: bool = False,
+) -> List[Optional[str]]:
+    # Each worker opens the file itself: readers and pages do not pickle cheaply.
+    workers = min(workers, total_pages)
+    step = -(-total_pages // workers)
+    ranges = [(start, min(start + step, total_pages)) for start in range(0, total_pages, step)]
+    page_texts: List[Optional[str]] = []
+    extract = partial(_extract_page_range, pdf_path, skip_latin_only=skip_latin_only)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for texts in executor.map(extract, ranges):
+            page_texts.extend(texts)
+    return page_texts
+
+
+def _looks_like_scan(page) -> bool:
+    """Return True for pages with no fonts and only image XObjects (no text)."""
+
+    resources = page.get("/Resources")
+    if resources is None:
+        return True
+    resources = resources.get_object()
+    if resources.get("/Font"):
+        return False
+    xobjects = resources.get("/XObject")
+    if xobjects is not None:
+        for xobject in xobjects.get_object().values():
+            if xobject.get_object().get("/Subtype") != "/Image":
+                return False
+    return True
+
+
+def _page_uses_cjk_fonts(page) -> Optional[bool]:
+    """Classify a page from its font resources without decoding any text.
+
+    Returns True when a font uses an Adobe CJK collection, False when every
+    font is a simple font that can only decode to non-CJK text, and None when
+    the fonts cannot decide (no fonts, form XObjects, ToUnicode maps, custom
+    encodings or non-CJK CID fonts).
+    """
+
+    resources = page.get("/Resources")
+    if resources is None:
+        return None
+    resources = resources.get_object()
+
+    # Form XObjects carry their own font resources; leave those to extraction.
+    xobjects = resources.get("/XObject")
+    if xobjects is not None:
+        for xobject in xobjects.get_object().values():
+            if xobject.get_object().get("/Subtype") == "/Form":
+                return None
+
+    fonts = resources.get("/Font")
+    fonts = fonts.get_object() if fonts is not None else None
+    if not fonts:
+        return None
+
+    ambiguous = False
+    for font_ref in fonts.values():
+        font = font_ref.get_object()
+        subtype = font.get("/Subtype")
+        if subtype == "/Type0":
+            for descendant in font.get("/DescendantFonts", ()):
+                info = descendant.get_object().get("/CIDSystemInfo")
+                ordering = info.get_object().get("/Ordering") if info is not None else None
+                if ordering is not None and str(ordering) in _CJK_CID_ORDERINGS:
+                    return True
+            ambiguous = True
+            continue
+        encoding = font.get("/Encoding")
+        if (
+            subtype not in _SIMPLE_FONT_SUBTYPES
+            or "/ToUnicode" in font
+            or (encoding is not None and not isinstance(encoding.get_object(), NameObject))
+        ):
+            ambiguous = True
+    return None if ambiguous else False
+
+
 def _is_chinese_dominant(
     text: str,
     chinese_threshold: int,
     ascii_ratio_threshold: float,
 ) -> bool:
-    chinese = sum(1 for ch in text if _is_cjk(ch))
-    ascii_letters = sum(1 for ch in text if ch.isascii() and ch.isalpha())
-
+    # isascii() reads a flag CPython keeps on every str, so pure-English pages
+    # skip the CJK scan entirely.
+    chinese = 0 if text.isascii() else _count_cjk_up_to(text, chinese_threshold)
     if chinese >= chinese_threshold:
         return True
 
+    ascii_letters = len(text.encode("ascii", errors="ignore").translate(None, _NON_LETTER_BYTES))
+
     total_letters = chinese + ascii_letters
     if total_letters == 0:
         # Empty or symbols-only page; treat as English to allow removal.
@@ -120,6 +460,12 @@ def _is_chinese_dominant(
     return ascii_ratio < ascii_ratio_threshold
 
 
-def _is_cjk(char: str) -> bool:
-    return "\u4e00" <= char <= "\u9fff"
+def _count_cjk_up_to(text: str, limit: int) -> int:
+    """Count CJK characters, stopping early once ``limit`` is reached."""
 
+    count = 0
+    for match in _CJK_RUN_PATTERN.finditer(text):
+        count += match.end() - match.start()
+        if count >= limit:
+            break
+    return count
@@ -3,22 +3,75 @@
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
 LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DEFAULT_LEVEL = logging.INFO
+# Records buffered before the log file is written; errors flush immediately.
+LOG_BUFFER_CAPACITY = 1024
 
 
 def setup_logging(level: int = DEFAULT_LEVEL, log_file: Optional[Path] = None) -> None:
-    """Configure root logging with optional file handler."""
+    """Configure root logging with optional buffered file handler."""
 
     logging.basicConfig(level=level, format=LOG_FORMAT)
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
         file_handler.setLevel(level)
         file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-        logging.getLogger().addHandler(file_handler)
+        buffered_handler = MemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        )
+        buffered_handler.setLevel(level)
+        logging.getLogger().addHandler(buffered_handler)
 
+
+class _DispatchHandler(logging.Handler):
+    """Hand records relayed from worker processes to this process's loggers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+@contextmanager
+def forward_worker_logging(context: BaseContext) -> Iterator[object]:
+    """Yield a queue that workers log into; its records reach this process's handlers.
+
+    Pass the queue to :func:`init_worker_logging` as the pool initializer.
+    """
+
+    log_queue = context.Queue()
+    listener = QueueListener(log_queue, _DispatchHandler())
+    listener.start()
+    try:
+        yield log_queue
+    finally:
+        listener.stop()
+        log_queue.close()
+        log_queue.join_thread()
+
+
+def init_worker_logging(log_queue, level: int) -> None:
+    """Route a worker process's logging through ``log_queue``.
+
+    Workers started by spawn/forkserver have no handlers configured, and forked
+    ones inherit copies of the parent's handlers (and buffered records), so the
+    root handlers are replaced either way.
+    """
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, MemoryHandler):
+            with handler.lock:
+                handler.buffer.clear()
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
@@ -0,0 +1,20 @@
+from hsbc_data_cleaner.chunking.chunker import chunk_section_text
+
+
+def test_chunk_section_text_overlapping_windows():
+    chunks = chunk_section_text("intro", "  " + "abcdefghij" * 2 + "  ", chunk_size=8, overlap=3)
+
+    assert [(chunk.start_offset, chunk.end_offset) for chunk in chunks] == [
+        (0, 8),
+        (5, 13),
+        (10, 18),
+        (15, 20),
+    ]
+    assert [chunk.index for chunk in chunks] == [0, 1, 2, 3]
+    assert chunks[1].text == "fghijabc"
+
+
+def test_chunk_section_text_skips_blank_windows():
+    chunks = chunk_section_text("intro", "ab" + " " * 10 + "cd", chunk_size=4, overlap=0)
+
+    assert [(chunk.index, chunk.text) for chunk in chunks] == [(0, "ab"), (1, "cd")]
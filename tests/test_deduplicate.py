@@ -0,0 +1,88 @@
+import pytest
+
+from hsbc_data_cleaner.cleaning.deduplicate import ChunkIndex, evaluate_sections, load_index
+from hsbc_data_cleaner.parsers.pdf_parser import PdfSection
+
+
+def _sections(*texts):
+    return [
+        PdfSection(name=f"section_{idx}", title="", pages=[1], lines=[text])
+        for idx, text in enumerate(texts)
+    ]
+
+
+def test_evaluate_sections_classifies_against_previous_quarter(tmp_path):
+    index_path = tmp_path / "chunk_index.json"
+    evaluate_sections("F1", "2025Q1", _sections("a", "b"), index_path=index_path)
+
+    results = evaluate_sections("F1", "2025Q2", _sections("a", "changed", "c"), index_path=index_path)
+
+    assert [result.status for result in results] == ["reuse", "updated", "new"]
+    assert set(load_index(index_path)["F1"]) == {"2025Q1", "2025Q2"}
+
+
+def test_evaluate_sections_with_preloaded_index_does_not_write(tmp_path):
+    index_path = tmp_path / "chunk_index.json"
+    index = {}
+
+    first = evaluate_sections("F1", "2025Q2", _sections("a"), index_path=index_path, index=index)
+    rerun = evaluate_sections("F1", "2025Q2", _sections("a"), index_path=index_path, index=index)
+
+    assert first[0].status == "new"
+    assert rerun[0].status == "reuse"
+    assert not index_path.exists()
+
+
+def test_chunk_index_keeps_committed_entries_on_failure(tmp_path):
+    index_path = tmp_path / "chunk_index.json"
+
+    with pytest.raises(RuntimeError):
+        with ChunkIndex.load(index_path) as index:
+            index.evaluate("F1", "2025Q2", _sections("a"))
+            raise RuntimeError("boom")
+    assert not index_path.exists()
+
+    with pytest.raises(RuntimeError):
+        with ChunkIndex.load(index_path) as index:
+            index.evaluate("F1", "2025Q2", _sections("a"))
+            index.commit()
+            index.evaluate("F2", "2025Q2", _sections("b"))
+            raise RuntimeError("boom")
+    assert set(load_index(index_path)) == {"F1"}
+
+    with ChunkIndex.load(index_path) as index:
+        rerun = index.evaluate("F1", "2025Q2", _sections("a"))
+        index.evaluate("F2", "2025Q2", _sections("b"))
+
+    assert rerun[0].status == "reuse"
+    assert set(load_index(index_path)) == {"F1", "F2"}
+
+
+def test_evaluate_sections_accepts_iterators(tmp_path):
+    index = {}
+
+    results = evaluate_sections("F1", "2025Q1", iter(_sections("a", "b")), index=index)
+
+    assert [result.status for result in results] == ["new", "new"]
+    assert set(index["F1"]["2025Q1"]) == {"section_0:0", "section_1:1"}
+
+    with ChunkIndex(path=tmp_path / "chunk_index.json", data=index) as chunk_index:
+        rerun = chunk_index.evaluate("F1", "2025Q1", iter(_sections("a", "b")))
+
+    assert [result.status for result in rerun] == ["reuse", "reuse"]
+
+
+def test_evaluate_sections_reports_removed_sections():
+    index = {}
+    evaluate_sections("F1", "2025Q1", _sections("a", "b"), index=index)
+
+    rerun = evaluate_sections("F1", "2025Q1", _sections("a"), index=index)
+    next_quarter = evaluate_sections("F1", "2025Q2", _sections("a"), index=index)
+
+    assert [(result.key, result.status) for result in rerun] == [
+        ("section_0:0", "reuse"),
+        ("section_1:1", "removed"),
+    ]
+    assert rerun[1].current_hash is None
+    assert rerun[1].compared_quarter == "2025Q1"
+    assert [result.status for result in next_quarter] == ["reuse"]
@@ -0,0 +1,270 @@
+import pypdf
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    ContentStream,
+    DictionaryObject,
+    NameObject,
+    TextStringObject,
+)
+
+from hsbc_data_cleaner.preprocessing import english_filter
+from hsbc_data_cleaner.preprocessing.english_filter import (
+    _is_chinese_dominant,
+    _looks_like_scan,
+    _page_uses_cjk_fonts,
+    prune_classification_cache,
+    remove_english_pages,
+)
+
+
+def _page(**fonts):
+    return DictionaryObject(
+        {
+            NameObject("/Resources"): DictionaryObject(
+                {
+                    NameObject("/Font"): DictionaryObject(
+                        {NameObject(f"/{name}"): DictionaryObject(font) for name, font in fonts.items()}
+                    )
+                }
+            )
+        }
+    )
+
+
+_HELVETICA = {
+    NameObject("/Subtype"): NameObject("/Type1"),
+    NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
+}
+_MSUNG = {
+    NameObject("/Subtype"): NameObject("/Type0"),
+    NameObject("/DescendantFonts"): ArrayObject(
+        [
+            DictionaryObject(
+                {
+                    NameObject("/CIDSystemInfo"): DictionaryObject(
+                        {NameObject("/Ordering"): TextStringObject("CNS1")}
+                    )
+                }
+            )
+        ]
+    ),
+}
+
+
+def test_is_chinese_dominant_keeps_pages_over_cjk_threshold():
+    assert _is_chinese_dominant("滙豐環球投資基金十大持股 Top 10 Holdings", 10, 0.8)
+
+
+def test_is_chinese_dominant_uses_ascii_ratio_below_threshold():
+    assert not _is_chinese_dominant("Important information 重要", 10, 0.8)
+    assert _is_chinese_dominant("基金 ABC 123 ÉÉÉ", 10, 0.8)
+    assert not _is_chinese_dominant("12.5% --", 10, 0.8)
+
+
+def test_page_uses_cjk_fonts_only_rules_out_cjk_when_certain():
+    assert _page_uses_cjk_fonts(_page(F1=_HELVETICA)) is False
+    assert _page_uses_cjk_fonts(_page(F1=_HELVETICA, F2=_MSUNG)) is True
+    with_to_unicode = {**_HELVETICA, NameObject("/ToUnicode"): DictionaryObject()}
+    assert _page_uses_cjk_fonts(_page(F1=with_to_unicode)) is None
+    assert _page_uses_cjk_fonts(DictionaryObject()) is None
+
+
+def test_looks_like_scan_requires_only_image_xobjects():
+    image = DictionaryObject({NameObject("/Subtype"): NameObject("/Image")})
+    scan = DictionaryObject(
+        {
+            NameObject("/Resources"): DictionaryObject(
+                {NameObject("/XObject"): DictionaryObject({NameObject("/Im0"): image})}
+            )
+        }
+    )
+
+    assert _looks_like_scan(scan)
+    assert _looks_like_scan(DictionaryObject())
+    assert not _looks_like_scan(_page(F1=_HELVETICA))
+
+
+def test_remove_english_pages_accepts_custom_classifier(tmp_path):
+    pdf_path = tmp_path / "blank.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    writer.add_blank_page(width=200, height=200)
+    with pdf_path.open("wb") as handle:
+        writer.write(handle)
+
+    assert remove_english_pages(pdf_path).kept_pages == []
+    assert remove_english_pages(pdf_path, classifier=lambda text: True).kept_pages == [1, 2]
+
+
+def test_remove_english_pages_reuses_cached_classification(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "blank.pdf"
+    writer = PdfWriter()
+    writer.add_blank_page(width=200, height=200)
+    with pdf_path.open("wb") as handle:
+        writer.write(handle)
+    cache_dir = tmp_path / "cache"
+
+    first = remove_english_pages(pdf_path, cache_dir=cache_dir)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("classification should come from the cache")
+
+    monkeypatch.setattr(english_filter, "_classify_pages", _fail)
+    second = remove_english_pages(pdf_path, cache_dir=cache_dir)
+
+    assert (second.kept_pages, second.removed_pages, second.total_pages) == (
+        first.kept_pages,
+        first.removed_pages,
+        first.total_pages,
+    )
+    with pytest.raises(AssertionError):
+        remove_english_pages(pdf_path, cache_dir=cache_dir, chinese_threshold=5)
+
+
+class _FakeTextPage:
+    def __init__(self, text, closed):
+        self._text = text
+        self._closed = closed
+
+    def get_text_range(self):
+        return self._text
+
+    def close(self):
+        self._closed.append("textpage")
+
+
+class _FakePage:
+    def __init__(self, text, closed):
+        self._text = text
+        self._closed = closed
+
+    def get_textpage(self):
+        return _FakeTextPage(self._text, self._closed)
+
+    def close(self):
+        self._closed.append("page")
+
+
+def _fake_pdfium(texts, closed):
+    class _FakeDocument:
+        def __init__(self, path):
+            pass
+
+        def __len__(self):
+            return len(texts)
+
+        def __getitem__(self, index):
+            return _FakePage(texts[index], closed)
+
+        def close(self):
+            closed.append("document")
+
+    return type("pdfium", (), {"PdfDocument": _FakeDocument})
+
+
+def _write_text_pdf(path, texts):
+    writer = PdfWriter()
+    font = DictionaryObject({**_HELVETICA, NameObject("/BaseFont"): NameObject("/Helvetica")})
+    for text in texts:
+        page = writer.add_blank_page(width=200, height=200)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        content = ContentStream(None, None)
+        content.set_data(f"BT /F1 12 Tf 20 100 Td ({text}) Tj ET".encode("latin-1"))
+        page.replace_contents(content)
+    with path.open("wb") as handle:
+        writer.write(handle)
+
+
+def _write_blank_pdf(path, page_count):
+    writer = PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(width=200, height=200)
+    with path.open("wb") as handle:
+        writer.write(handle)
+
+
+def test_remove_english_pages_normalises_pdfium_line_endings(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "blank.pdf"
+    _write_blank_pdf(pdf_path, 2)
+    closed = []
+    monkeypatch.setattr(english_filter, "pdfium", _fake_pdfium(["a\r\nb", "c"], closed))
+
+    result = remove_english_pages(pdf_path, classifier=lambda text: True)
+
+    assert list(result.kept_texts) == ["a\nb", "c"]
+    assert closed == ["textpage", "page", "textpage", "page", "document"]
+
+
+def test_remove_english_pages_falls_back_on_pdfium_page_count_mismatch(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "blank.pdf"
+    output_path = tmp_path / "out" / "blank.pdf"
+    _write_blank_pdf(pdf_path, 2)
+    closed = []
+    monkeypatch.setattr(english_filter, "pdfium", _fake_pdfium(["pdfium"], closed))
+
+    result = remove_english_pages(pdf_path, output_path, classifier=lambda text: True)
+
+    assert result.kept_pages == [1, 2]
+    assert list(result.kept_texts) == ["", ""]
+    assert output_path.exists()
+    assert closed == ["document"]
+
+
+def test_cache_key_tracks_backend_library_versions(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "blank.pdf"
+    _write_blank_pdf(pdf_path, 1)
+    monkeypatch.setattr(english_filter, "pdfium", None)
+    key = english_filter._cache_key(pdf_path, 10, 0.8)
+
+    assert key["backend"] == "pypdf"
+    assert key["pypdf"] == pypdf.__version__
+    assert key["pypdfium2"] is None
+
+
+def test_prune_classification_cache_keeps_only_given_pdfs(tmp_path):
+    cache_dir = tmp_path / "cache"
+    kept, dropped = tmp_path / "kept.pdf", tmp_path / "dropped.pdf"
+    for pdf_path in (kept, dropped):
+        _write_blank_pdf(pdf_path, 1)
+        remove_english_pages(pdf_path, cache_dir=cache_dir)
+
+    assert prune_classification_cache(cache_dir, [kept]) == 1
+    expected = english_filter._cache_path(cache_dir, kept)
+    assert list(cache_dir.iterdir()) == [expected]
+
+
+def test_remove_english_pages_in_parallel_matches_serial_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(english_filter, "pdfium", None)
+    parallel_calls = []
+    extract_parallel = english_filter._extract_page_texts_parallel
+
+    def _spy(pdf_path, total_pages, workers, skip_latin_only=False):
+        parallel_calls.append((total_pages, workers))
+        return extract_parallel(pdf_path, total_pages, workers, skip_latin_only)
+
+    monkeypatch.setattr(english_filter, "_extract_page_texts_parallel", _spy)
+    pdf_path = tmp_path / "text.pdf"
+    single_path = tmp_path / "single.pdf"
+    # Five pages split unevenly across the two workers' page ranges.
+    _write_text_pdf(pdf_path, [f"Page {number}" for number in range(1, 6)])
+    _write_text_pdf(single_path, ["Only page"])
+
+    def keep_all(text):
+        return True
+
+    serial = remove_english_pages(pdf_path, classifier=keep_all)
+    parallel = remove_english_pages(pdf_path, workers=2, classifier=keep_all)
+
+    assert list(serial.kept_texts) == [f"Page {number}" for number in range(1, 6)]
+    assert (parallel.kept_pages, list(parallel.kept_texts)) == (
+        serial.kept_pages,
+        list(serial.kept_texts),
+    )
+    # A single page is extracted in-process even when workers are requested.
+    single = remove_english_pages(single_path, workers=2, classifier=keep_all)
+    assert list(single.kept_texts) == ["Only page"]
+    assert parallel_calls == [(5, 2)]
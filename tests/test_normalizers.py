@@ -9,3 +9,8 @@ def test_normalize_line_whitespace_and_punctuation():
 def test_normalize_lines_filters_empty():
     lines = ["   foo   ", "", "  ", "bar"]
     assert normalize_lines(lines) == ["foo", "bar"]
+
+
+def test_normalize_line_spaces_after_punctuation_runs():
+    assert normalize_line("a,b;c:d") == "a, b; c: d"
+    assert normalize_line("費用：1.5%，每年") == "費用: 1.5%, 每年"
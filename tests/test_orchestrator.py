@@ -0,0 +1,165 @@
+import json
+import logging
+import multiprocessing
+import shutil
+
+import pytest
+from pypdf.errors import PdfReadError
+
+from hsbc_data_cleaner.config import AppConfig
+from hsbc_data_cleaner.orchestrator import _extraction_pool, _iter_extracted_pdfs, run_cleaning
+
+
+def _write_text_pdf(path, lines):
+    """Write a one-page Helvetica PDF with the given lines of text."""
+
+    operations = ["BT", "/F1 12 Tf", "72 720 Td", "14 TL"]
+    operations += [f"({line}) Tj T*" for line in lines]
+    operations.append("ET")
+    content = "\n".join(operations).encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+    payload = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(payload))
+        payload += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_offset = len(payload)
+    payload += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    payload += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    payload += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref_offset,
+    )
+    path.write_bytes(bytes(payload))
+
+
+def _settings(tmp_path):
+    return AppConfig(
+        raw_dir=tmp_path / "raw",
+        clean_pdf_dir=tmp_path / "clean" / "pdf",
+        clean_chunks_dir=tmp_path / "clean" / "chunks",
+        structured_dir=tmp_path / "structured",
+        state_dir=tmp_path / "state",
+        log_dir=tmp_path / "logs",
+    )
+
+
+def _write_fund_pdfs(directory, *codes):
+    directory.mkdir(parents=True, exist_ok=True)
+    for code in codes:
+        _write_text_pdf(
+            directory / f"Fund_{code}.pdf",
+            ["Important Information", f"Fund {code} invests in Asian equities."],
+        )
+
+
+def test_run_cleaning_skips_same_quarter_rerun_but_not_new_quarter(tmp_path):
+    settings = _settings(tmp_path)
+    _write_fund_pdfs(tmp_path / "raw" / "2025-Q2", "F001")
+
+    run_cleaning(settings, "2025Q2", max_workers=1)
+    run_cleaning(settings, "2025Q2", max_workers=1)
+
+    assert len(list((tmp_path / "clean" / "chunks" / "2025-Q2").iterdir())) == 1
+
+    shutil.copytree(tmp_path / "raw" / "2025-Q2", tmp_path / "raw" / "2025-Q3")
+    run_cleaning(settings, "2025Q3", max_workers=1)
+
+    assert len(list((tmp_path / "clean" / "chunks" / "2025-Q3").iterdir())) == 1
+
+
+def test_run_cleaning_rewrites_output_when_rerun_output_is_stale(tmp_path):
+    settings = _settings(tmp_path)
+    raw_dir = tmp_path / "raw" / "2025-Q2"
+    raw_dir.mkdir(parents=True)
+    pdf_path = raw_dir / "Fund_F001.pdf"
+    chunks_dir = tmp_path / "clean" / "chunks" / "2025-Q2"
+    _write_text_pdf(
+        pdf_path,
+        ["Important Information", "Invests in Asia.", "Fees and Charges", "1.5% a year."],
+    )
+    run_cleaning(settings, "2025Q2", max_workers=1)
+
+    # A dropped trailing section leaves every remaining section a "reuse".
+    _write_text_pdf(pdf_path, ["Important Information", "Invests in Asia."])
+    run_cleaning(settings, "2025Q2", max_workers=1)
+    assert len(list(chunks_dir.iterdir())) == 2
+
+    for path in chunks_dir.iterdir():
+        path.unlink()
+    run_cleaning(settings, "2025Q2", max_workers=1)
+    assert len(list(chunks_dir.iterdir())) == 1
+
+    other_dir = tmp_path / "elsewhere"
+    run_cleaning(settings, "2025Q2", chunks_dir=other_dir, max_workers=1)
+    assert len(list(other_dir.rglob("*.jsonl"))) == 1
+
+
+def test_run_cleaning_without_incremental_bypasses_filter_cache(tmp_path):
+    settings = _settings(tmp_path)
+    _write_fund_pdfs(tmp_path / "raw" / "2025-Q2", "F001")
+
+    run_cleaning(settings, "2025Q2", incremental=False, max_workers=1)
+    assert not (tmp_path / "state" / "english_filter").exists()
+
+    run_cleaning(settings, "2025Q2", max_workers=1)
+    assert len(list((tmp_path / "state" / "english_filter" / "2025-Q2").iterdir())) == 1
+
+
+def test_run_cleaning_with_worker_pool_processes_every_pdf(tmp_path):
+    settings = _settings(tmp_path)
+    _write_fund_pdfs(tmp_path / "raw" / "2025-Q2", "F001", "F002")
+
+    run_cleaning(settings, "2025Q2", max_workers=2)
+
+    assert len(list((tmp_path / "clean" / "chunks" / "2025-Q2").iterdir())) == 2
+    index = json.loads((tmp_path / "state" / "chunk_index.json").read_text(encoding="utf-8"))
+    assert {fund: list(quarters) for fund, quarters in index.items()} == {
+        "F001": ["2025Q2"],
+        "F002": ["2025Q2"],
+    }
+    assert multiprocessing.active_children() == []
+
+
+def test_extraction_pool_relays_worker_logs_under_spawn(tmp_path, caplog):
+    _write_fund_pdfs(tmp_path / "raw", "F001", "F002")
+    input_pdfs = sorted((tmp_path / "raw").iterdir())
+    caplog.set_level(logging.INFO)
+
+    with _extraction_pool(2, multiprocessing.get_context("spawn")) as executor:
+        extracted = list(_iter_extracted_pdfs(input_pdfs, tmp_path / "clean", executor))
+
+    assert [item.input_pdf for item in extracted] == input_pdfs
+    relayed = [
+        record.getMessage()
+        for record in caplog.records
+        if record.processName != "MainProcess"
+    ]
+    assert sorted(relayed) == [
+        "All pages classified as English in Fund_F001.pdf; no file written.",
+        "All pages classified as English in Fund_F002.pdf; no file written.",
+    ]
+
+
+def test_run_cleaning_keeps_index_progress_when_a_later_pdf_fails(tmp_path):
+    settings = _settings(tmp_path)
+    raw_dir = tmp_path / "raw" / "2025-Q2"
+    _write_fund_pdfs(raw_dir, "F001")
+    (raw_dir / "Fund_F002.pdf").write_bytes(b"not a pdf")
+
+    with pytest.raises(PdfReadError):
+        run_cleaning(settings, "2025Q2", max_workers=1)
+
+    _write_fund_pdfs(raw_dir, "F002")
+    run_cleaning(settings, "2025Q2", max_workers=1)
+
+    chunks_dir = tmp_path / "clean" / "chunks" / "2025-Q2"
+    assert len(list(chunks_dir.glob("*F001*"))) == 1
+    assert len(list(chunks_dir.glob("*F002*"))) == 1
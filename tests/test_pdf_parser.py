@@ -0,0 +1,115 @@
+import re
+
+from hsbc_data_cleaner.parsers.pdf_parser import (
+    DEFAULT_SECTION_DEFINITIONS,
+    PdfSection,
+    SectionDefinition,
+    _clean_company_name,
+    _match_section,
+    _SectionMatcher,
+    extract_top_holdings_entries,
+)
+
+
+def test_match_section_prefers_earlier_definition():
+    matcher = _SectionMatcher.build(DEFAULT_SECTION_DEFINITIONS)
+
+    # Definition order decides, not the position of the match within the line.
+    assert _match_section("十大持股 重要事項", matcher).name == "important_information"
+    assert _match_section("TOP 10  Holdings", matcher).name == "top_holdings"
+    assert _match_section("本基金投資於亞洲股票", matcher) is None
+
+
+def test_match_section_keeps_grouped_patterns_working():
+    definitions = [SectionDefinition(name="repeat", patterns=[re.compile(r"(ab)\1")])]
+    matcher = _SectionMatcher.build(definitions)
+
+    assert matcher.combined is None
+    assert _match_section("xxabab", matcher).name == "repeat"
+    assert _match_section("xxab", matcher) is None
+
+
+def test_pdf_section_text_tracks_line_edits():
+    section = PdfSection(name="fees_charges", title="費用", lines=["管理費"])
+    assert section.text == "管理費"
+
+    section.lines.append("每年1.5%")
+    assert section.text == "管理費\n每年1.5%"
+
+    section.lines[0] = "認購費"
+    assert section.text == "認購費\n每年1.5%"
+
+    section.lines = ["贖回費"]
+    assert section.text == "贖回費"
+    section.lines = ["轉換費"]
+    assert section.text == "轉換費"
+    assert section == PdfSection(name="fees_charges", title="費用", lines=["轉換費"])
+
+
+def test_match_section_keeps_inline_flag_patterns_working():
+    definitions = [SectionDefinition(name="fees", patterns=[re.compile(r"(?i)fees and charges")])]
+    matcher = _SectionMatcher.build(definitions)
+
+    assert matcher.combined is None
+    assert _match_section("FEES AND CHARGES", matcher).name == "fees"
+    assert _match_section("Risk factors", matcher) is None
+
+
+def _holdings(title, *lines):
+    section = PdfSection(name="top_holdings", title=title, lines=list(lines))
+    return [(entry.name, entry.instrument_type) for entry in extract_top_holdings_entries(section)]
+
+
+def test_extract_top_holdings_joins_wrapped_names():
+    assert _holdings(
+        "十大持股",
+        "Taiwan Semiconductor",
+        "  Manufacturing   Co Ltd 9.5%",
+        "騰訊控股",
+        "Tencent Holdings 7.2%",
+    ) == [
+        ("Taiwan Semiconductor Manufacturing Co Ltd", "equity"),
+        ("騰訊控股 Tencent Holdings", "equity"),
+    ]
+
+
+def test_extract_top_holdings_flushes_only_on_a_trailing_value():
+    assert _holdings(
+        "Top 10 Holdings",
+        "Meituan 2.25",
+        "Alibaba Group Holding",
+        "3.1%",
+        # A percentage inside the name, or a detached "%", drops the candidate.
+        "Yield 5% Fund Units 4.0%",
+        "HDFC Bank 1.5 %",
+        "Reliance 2.0",
+    ) == [("Meituan", "equity"), ("Alibaba Group Holding", "equity")]
+
+
+def test_extract_top_holdings_splits_equity_and_fixed_income():
+    assert _holdings(
+        "十大持股",
+        "Tencent Holdings Information Technology 9.5%",
+        "Total 40.0%",
+        "固定收益十大持倉",
+        "查閱",
+        "China Gov Bond 2.1%",
+        "組合分佈",
+        "After Stop 1.0%",
+    ) == [("Tencent Holdings", "equity"), ("China Gov Bond", "fixed_income")]
+    # Without a typed header, the holding name decides.
+    assert _holdings(
+        "",
+        "US Treasury Note 2030 4.2%",
+        "Sector Weight",
+        "Apple Inc 3.0%",
+        "合共 7.2%",
+    ) == [("US Treasury Note 2030", "fixed_income"), ("Apple Inc", "equity")]
+
+
+def test_clean_company_name_drops_trailing_cjk_metadata():
+    assert _clean_company_name("Tencent Holdings 騰訊控股 香港") == "Tencent Holdings"
+    assert _clean_company_name("騰訊控股 資訊科技") == "騰訊控股"
+    assert _clean_company_name("友邦保險") == "友邦保險"
+    assert _clean_company_name("  HSBC   Holdings plc ") == "HSBC Holdings plc"
+    assert _clean_company_name("   ") == ""
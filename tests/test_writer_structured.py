@@ -0,0 +1,32 @@
+import csv
+
+from hsbc_data_cleaner.outputs.writer_structured import (
+    append_top_holdings_companies,
+    compact_top_holdings,
+)
+
+
+def _rows(path):
+    with path.open(newline="", encoding="utf-8") as handle:
+        return [row[0] for row in csv.reader(handle)]
+
+
+def test_append_top_holdings_companies_appends_only_new_names(tmp_path):
+    append_top_holdings_companies(["Tencent Holdings Ltd", "Samsung Electronics Co., Ltd"], "2025Q2", tmp_path)
+    append_top_holdings_companies(["tencent holdings ltd", "Alibaba Group", "Alibaba Group"], "2025Q3", tmp_path)
+
+    assert _rows(tmp_path / "top_holdings_companies.csv") == [
+        "company_name",
+        "Samsung Electronics Co., Ltd",
+        "Tencent Holdings Ltd",
+        "Alibaba Group",
+    ]
+
+
+def test_compact_top_holdings_sorts_case_insensitively(tmp_path):
+    append_top_holdings_companies(["b", "C"], "2025Q2", tmp_path)
+    append_top_holdings_companies(["a"], "2025Q3", tmp_path)
+
+    compact_top_holdings(tmp_path)
+
+    assert _rows(tmp_path / "top_holdings_companies.csv") == ["company_name", "a", "b", "C"]